@@ -1,6 +1,41 @@
 from __future__ import annotations
-from typing import Callable, FrozenSet, Iterable, Iterator, Tuple, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterator, Tuple, List
+import functools
+import multiprocessing
+import os
+import sys
 import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Optional: Numba-JIT für den dichten Kernel (fällt ohne Numba auf NumPy zurück)
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+
+# Optional: Cython-Kernel (siehe gol_kernel.pyx / setup.py)
+try:
+    import gol_kernel as _gol_kernel
+except ImportError:  # pragma: no cover
+    _gol_kernel = None
+
+# Optional: AVX2-Kernel für das bit-gepackte Grid (siehe gol_simd.c / setup.py)
+try:
+    import gol_simd as _gol_simd
+except ImportError:  # pragma: no cover
+    _gol_simd = None
+
+# Optional: GPU-Backend via CuPy (fällt ohne CuPy/GPU auf den CPU-Pfad zurück)
+try:  # pragma: no cover - hängt von der Maschine ab
+    import cupy as _cp
+    if _cp.cuda.runtime.getDeviceCount() < 1:
+        _cp = None
+except Exception:  # ImportError oder CUDA-Laufzeitfehler
+    _cp = None
 
 # Typen (unendliches Grid als Menge lebender Zellen)
 Cell = Tuple[int, int]
@@ -14,6 +49,17 @@ NEIGH: Tuple[Cell, ...] = tuple(
     if (dx, dy) != (0, 0)
 )
 
+# Gepackte Zellen: (x, y) als ein int64 statt Tupel — ein Int-Hash statt
+# Tupel-Allokation pro Nachbarschaftstest. BIAS hält beide Felder positiv.
+BIAS = 1 << 31
+NEIGH_PACKED: Tuple[int, ...] = tuple((dx << 32) + dy for dx, dy in NEIGH)
+
+def pack_cell(x: int, y: int) -> int:
+    return ((x + BIAS) << 32) | (y + BIAS)
+
+def unpack_cell(c: int) -> Cell:
+    return (c >> 32) - BIAS, (c & 0xFFFFFFFF) - BIAS
+
 # Regeln (pure functions)
 def conway_rule(is_alive: bool, n: int) -> bool:
     return (n == 3) or (is_alive and n == 2)
@@ -22,59 +68,630 @@ def highlife_rule(is_alive: bool, n: int) -> bool:
     return (n in (3, 6)) or (is_alive and n == 2)
 
 # Kernlogik: unendlicher Step über Alive-Set
-def neighbors(c: Cell) -> Iterable[Cell]:
+# n8 liefert ein fertiges Tupel statt eines Generators: keine Generator-Frames
+# und kein Tupel-Neuaufbau pro Delta beim Konsumieren.
+def n8(c: Cell) -> Tuple[Cell, ...]:
     x, y = c
-    return ((x + dx, y + dy) for dx, dy in NEIGH)
+    return ((x - 1, y - 1), (x, y - 1), (x + 1, y - 1),
+            (x - 1, y), (x + 1, y),
+            (x - 1, y + 1), (x, y + 1), (x + 1, y + 1))
+
+def _n8_packed(c: int) -> Tuple[int, ...]:
+    o = NEIGH_PACKED
+    return (c + o[0], c + o[1], c + o[2], c + o[3],
+            c + o[4], c + o[5], c + o[6], c + o[7])
+
+def _neighbor_counter(packed: set) -> Counter:
+    """Ein Zähl-Durchlauf: Zelle mit >= 1 lebendem Nachbarn -> Nachbarsumme.
+    8 Hash-Inkremente pro lebender Zelle statt 16 Nachbar-Lookups."""
+    counts: Counter = Counter()
+    for c in packed:
+        for n in _n8_packed(c):
+            counts[n] += 1
+    return counts
 
 def step_func(rule: Rule) -> Callable[[Alive], Alive]:
     """
     Factory: gibt eine Step-Funktion zurück, parametrisiert mit 'rule'.
     Welt ist unendlich, gespeichert werden nur lebende Zellen (Alive-Set).
+    Für die bekannten Regeln wird eine spezialisierte Step-Variante erzeugt,
+    deren Filter die Regel als nackten Bool-Ausdruck inlined (kein
+    Python-Call pro Kandidatenzelle); fremde Regeln nehmen den generischen Pfad.
     """
-    def step(alive: Alive) -> Alive:
-        candidates = frozenset(alive | frozenset(n for c in alive for n in neighbors(c)))
+    if rule is conway_rule:
+        def step(alive: Alive) -> Alive:
+            packed = {pack_cell(x, y) for x, y in alive}
+            return frozenset(
+                unpack_cell(c)
+                for c, n in _neighbor_counter(packed).items()
+                if n == 3 or (n == 2 and c in packed)
+            )
+    elif rule is highlife_rule:
+        def step(alive: Alive) -> Alive:
+            packed = {pack_cell(x, y) for x, y in alive}
+            return frozenset(
+                unpack_cell(c)
+                for c, n in _neighbor_counter(packed).items()
+                if n == 3 or n == 6 or (n == 2 and c in packed)
+            )
+    else:
+        def step(alive: Alive) -> Alive:
+            packed = {pack_cell(x, y) for x, y in alive}
+            counts = _neighbor_counter(packed)
+            new = {c for c, n in counts.items() if rule(c in packed, n)}
+            if rule(True, 0):
+                # isolierte lebende Zellen tauchen in counts nicht auf
+                new |= {c for c in packed if c not in counts}
+            return frozenset(map(unpack_cell, new))
+    # Generationen-Memoisierung: Oszillatoren/Stillleben kosten nur noch ein Dict-Lookup
+    return functools.lru_cache(maxsize=4096)(step)
 
-        def n_alive(c: Cell) -> int:
-            return sum((n in alive) for n in neighbors(c))
+# Inkrementelle Variante: nur Zellen neu bewerten, deren Nachbarzahl sich geändert hat
+def step_func_incremental(rule: Rule) -> Callable[[Alive], Alive]:
+    """
+    Wie step_func, aber mit persistentem Nachbarzähler zwischen den Schritten:
+    pro Schritt werden nur die Zellen rund um die Geburten/Tode des letzten
+    Schritts neu bewertet ("dirty set") statt aller Kandidaten. Bei einem
+    unbekannten Eingabezustand werden die Zähler einmalig neu aufgebaut.
+    """
+    tracked: dict = {"alive": None, "counts": {}, "dirty": set()}
 
-        return frozenset(
-            c for c in candidates
-            if rule((c in alive), n_alive(c))
-        )
+    def step(alive_in: Alive) -> Alive:
+        alive = tracked["alive"]
+        if alive != alive_in:
+            # Zustand passt nicht zum mitgeführten: Zähler komplett neu aufbauen
+            alive = frozenset(alive_in)
+            counts: Dict[Cell, int] = {}
+            for c in alive:
+                for n in n8(c):
+                    counts[n] = counts.get(n, 0) + 1
+            tracked["counts"] = counts
+            tracked["dirty"] = alive | set(counts)
+        counts, dirty = tracked["counts"], tracked["dirty"]
+
+        births: List[Cell] = []
+        deaths: List[Cell] = []
+        for c in dirty:
+            now = c in alive
+            if rule(now, counts.get(c, 0)):
+                if not now:
+                    births.append(c)
+            elif now:
+                deaths.append(c)
+
+        # Zähler nur rund um die Änderungen fortschreiben und das nächste
+        # Dirty-Set daraus ableiten
+        next_dirty = set(births)
+        next_dirty.update(deaths)
+        for c in births:
+            for n in n8(c):
+                counts[n] = counts.get(n, 0) + 1
+                next_dirty.add(n)
+        for c in deaths:
+            for n in n8(c):
+                v = counts.get(n, 0) - 1
+                if v:
+                    counts[n] = v
+                else:
+                    counts.pop(n, None)
+                next_dirty.add(n)
+
+        result = frozenset((alive - frozenset(deaths)) | frozenset(births))
+        tracked["alive"] = result
+        tracked["dirty"] = next_dirty
+        return result
     return step
 
-# Generator, unendliche Generationen
+# Generator, unendliche Generationen (mit Zykluserkennung)
 def generations(start: Alive, step: Callable[[Alive], Alive]) -> Iterator[Alive]:
+    seen: Dict[Alive, int] = {}
+    history: List[Alive] = []
     alive = start
     while True:
+        idx = seen.get(alive)
+        if idx is not None:
+            # Zustand wiederholt sich: Zyklus endlos ausspielen, ohne step erneut zu rufen
+            cycle = history[idx:]
+            while True:
+                for state in cycle:
+                    yield state
+        seen[alive] = len(history)
+        history.append(alive)
         yield alive
         alive = step(alive)
 
+# Dichte NumPy-Variante: Alive-Set <-> uint8-Array (Bounding Box + 1 Zelle Halo)
+def to_array(alive: Alive) -> Tuple[np.ndarray, int, int]:
+    """
+    Materialisiert das Alive-Set als dichtes uint8-Array über der Bounding Box,
+    mit einem Rand von 2 toten Zellen: der innere Ring nimmt Geburten auf, der
+    äußere dient den Kernels als Halo, damit sie ohne Randprüfungen indizieren.
+    Rückgabe: (arr, minx, miny) mit arr[y - miny, x - minx] == 1 für lebende Zellen.
+    """
+    if not alive:
+        return np.zeros((3, 3), dtype=np.uint8), 0, 0
+    minx, maxx, miny, maxy = bbox(alive, pad=2)
+    arr = np.zeros((maxy - miny + 1, maxx - minx + 1), dtype=np.uint8)
+    xs = np.fromiter((x for x, _ in alive), dtype=np.intp, count=len(alive))
+    ys = np.fromiter((y for _, y in alive), dtype=np.intp, count=len(alive))
+    arr[ys - miny, xs - minx] = 1
+    return arr, minx, miny
+
+def from_array(arr: np.ndarray, minx: int = 0, miny: int = 0) -> Alive:
+    """Inverse zu to_array: dichtes Array zurück in ein Alive-Set heben."""
+    ys, xs = np.nonzero(arr)
+    return frozenset(zip((xs + minx).tolist(), (ys + miny).tolist()))
+
+def _neighbor_counts_inner(arr: np.ndarray) -> np.ndarray:
+    """
+    8er-Nachbarschaftssumme für den inneren Bereich arr[1:-1, 1:-1].
+    Der äußere Ring von arr dient als Halo — keine Randfälle, kein np.pad,
+    nur 8 Slice-Additionen über bestehende Views.
+    """
+    return (arr[:-2, :-2] + arr[:-2, 1:-1] + arr[:-2, 2:]
+            + arr[1:-1, :-2] + arr[1:-1, 2:]
+            + arr[2:, :-2] + arr[2:, 1:-1] + arr[2:, 2:])
+
+def _conway_kernel(alive_arr: np.ndarray, n: np.ndarray) -> np.ndarray:
+    return (n == 3) | (alive_arr & (n == 2))
+
+def _highlife_kernel(alive_arr: np.ndarray, n: np.ndarray) -> np.ndarray:
+    return (n == 3) | (n == 6) | (alive_arr & (n == 2))
+
+# Dispatch: Rule-Callable -> vektorisierter Kernel (statt Python-Call pro Zelle)
+_ARRAY_KERNELS: Dict[Rule, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    conway_rule: _conway_kernel,
+    highlife_rule: _highlife_kernel,
+}
+
+def step_func_numpy(rule: Rule) -> Callable[[Alive], Alive]:
+    """
+    Wie step_func, aber der Schritt rechnet auf einem dichten uint8-Array:
+    statt ~27 Hash-Lookups pro lebender Zelle eine Handvoll vektorisierter
+    C-Schleifen über die Bounding Box. Unbekannte Regeln fallen auf den
+    Set-basierten Pfad zurück.
+    """
+    kernel = _ARRAY_KERNELS.get(rule)
+    if kernel is None:
+        return step_func(rule)
+
+    def step(alive: Alive) -> Alive:
+        if not alive:
+            return alive
+        arr, minx, miny = to_array(alive)
+        n = _neighbor_counts_inner(arr)
+        nxt = kernel(arr[1:-1, 1:-1].astype(np.bool_), n)
+        return from_array(nxt, minx + 1, miny + 1)
+    return step
+
+# JIT-Variante: Numba-kompilierter Kernel, parallelisiert über Zeilen (ohne GIL)
+_RULE_IDS: Dict[Rule, int] = {conway_rule: 0, highlife_rule: 1}
+
+# Kachelgrößen für cache-geblockte Traversierung: TILE_W so gewählt, dass drei
+# Halo-Zeilen einer Kachel in L1 passen; bei Bedarf pro Maschine nachjustieren.
+TILE_H = 64
+TILE_W = 256
+
+if njit is not None:
+    @njit(parallel=True, boundscheck=False, cache=True)
+    def _step_numba(padded: np.ndarray, out: np.ndarray, rule_id: int,
+                    tile_h: int, tile_w: int) -> None:
+        """Ein Schritt über das 1-fach gepaddete Grid; out hat die ungepaddete Form.
+        Traversierung in (tile_h x tile_w)-Kacheln, Zeilenkacheln parallel."""
+        h, w = out.shape
+        n_ty = (h + tile_h - 1) // tile_h
+        for ty in prange(n_ty):
+            y0 = ty * tile_h
+            y1 = min(y0 + tile_h, h)
+            for x0 in range(0, w, tile_w):
+                x1 = min(x0 + tile_w, w)
+                for y in range(y0, y1):
+                    for x in range(x0, x1):
+                        n = (padded[y, x] + padded[y, x + 1] + padded[y, x + 2]
+                             + padded[y + 1, x] + padded[y + 1, x + 2]
+                             + padded[y + 2, x] + padded[y + 2, x + 1] + padded[y + 2, x + 2])
+                        alive = padded[y + 1, x + 1]
+                        if rule_id == 0:
+                            out[y, x] = 1 if n == 3 or (alive and n == 2) else 0
+                        else:
+                            out[y, x] = 1 if n == 3 or n == 6 or (alive and n == 2) else 0
+
+def step_func_jit(rule: Rule) -> Callable[[Alive], Alive]:
+    """
+    Wie step_func_numpy, aber der Kernel ist mit Numba kompiliert und läuft
+    zeilenparallel. Ohne installiertes Numba (oder für unbekannte Regeln)
+    wird transparent der NumPy-Pfad verwendet.
+    """
+    rule_id = _RULE_IDS.get(rule)
+    if njit is None or rule_id is None:
+        return step_func_numpy(rule)
+
+    def step(alive: Alive) -> Alive:
+        if not alive:
+            return alive
+        arr, minx, miny = to_array(alive)  # äußerer Ring = fertiges Halo
+        out = np.empty((arr.shape[0] - 2, arr.shape[1] - 2), dtype=np.uint8)
+        _step_numba(arr, out, rule_id, TILE_H, TILE_W)
+        return from_array(out, minx + 1, miny + 1)
+    return step
+
+# Multiprocessing-Variante: Zeilenstreifen mit 1-Zeilen-Halo über Worker verteilen
+MP_MIN_CELLS = 256 * 256  # darunter dominiert Fork-/IPC-Overhead den Gewinn
+
+_mp_state: dict = {}
+
+def _mp_init(in_name: str, out_name: str, padded_shape: Tuple[int, int]) -> None:
+    """Worker-Initializer: Shared-Memory-Puffer einmalig anhängen (statt Pickling)."""
+    _mp_state["in"] = shared_memory.SharedMemory(name=in_name)
+    _mp_state["out"] = shared_memory.SharedMemory(name=out_name)
+    _mp_state["shape"] = padded_shape
+
+def _mp_strip(args: Tuple[int, int, int]) -> None:
+    """Berechnet die Ausgabezeilen y0..y1 aus dem gepaddeten Eingabepuffer."""
+    y0, y1, rule_id = args
+    h, w = _mp_state["shape"]
+    padded = np.ndarray((h, w), dtype=np.uint8, buffer=_mp_state["in"].buf)
+    out = np.ndarray((h - 2, w - 2), dtype=np.uint8, buffer=_mp_state["out"].buf)
+    kernel = _conway_kernel if rule_id == 0 else _highlife_kernel
+    strip = padded[y0:y1 + 2]
+    n = (strip[:-2, :-2] + strip[:-2, 1:-1] + strip[:-2, 2:]
+         + strip[1:-1, :-2] + strip[1:-1, 2:]
+         + strip[2:, :-2] + strip[2:, 1:-1] + strip[2:, 2:])
+    out[y0:y1] = kernel(strip[1:-1, 1:-1].astype(np.bool_), n)
+
+def step_func_mp(rule: Rule, n_workers: int | None = None) -> Callable[[Alive], Alive]:
+    """
+    Wie step_func_numpy, aber große Grids werden in horizontale Streifen
+    zerlegt und in einem multiprocessing.Pool berechnet. Die Puffer liegen
+    im Shared Memory (Worker hängen sich einmalig an), kleine Grids laufen
+    in-process. step.close() räumt Pool und Shared Memory wieder ab.
+    """
+    kernel = _ARRAY_KERNELS.get(rule)
+    rule_id = _RULE_IDS.get(rule)
+    if rule_id is None:
+        return step_func(rule)
+    workers = n_workers or os.cpu_count() or 1
+    state: dict = {"pool": None, "shape": None, "in": None, "out": None}
+
+    def teardown() -> None:
+        if state["pool"] is not None:
+            state["pool"].terminate()
+            state["pool"].join()
+            state["pool"] = None
+        for key in ("in", "out"):
+            if state[key] is not None:
+                state[key].close()
+                state[key].unlink()
+                state[key] = None
+        state["shape"] = None
+
+    def step(alive: Alive) -> Alive:
+        if not alive:
+            return alive
+        arr, minx, miny = to_array(alive)
+        if workers == 1 or arr.size < MP_MIN_CELLS:
+            nxt = kernel(arr[1:-1, 1:-1].astype(np.bool_), _neighbor_counts_inner(arr))
+            return from_array(nxt, minx + 1, miny + 1)
+
+        out_shape = (arr.shape[0] - 2, arr.shape[1] - 2)
+        if state["shape"] != arr.shape:
+            # Puffergröße hat sich geändert: Pool + Shared Memory neu aufsetzen
+            teardown()
+            state["in"] = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+            state["out"] = shared_memory.SharedMemory(create=True,
+                                                      size=out_shape[0] * out_shape[1])
+            state["shape"] = arr.shape
+            state["pool"] = multiprocessing.Pool(
+                workers, initializer=_mp_init,
+                initargs=(state["in"].name, state["out"].name, arr.shape))
+        np.ndarray(arr.shape, dtype=np.uint8, buffer=state["in"].buf)[:] = arr
+
+        bounds = np.linspace(0, out_shape[0], workers + 1, dtype=int)
+        tasks = [(int(y0), int(y1), rule_id)
+                 for y0, y1 in zip(bounds[:-1], bounds[1:]) if y1 > y0]
+        state["pool"].map(_mp_strip, tasks)
+        out = np.ndarray(out_shape, dtype=np.uint8, buffer=state["out"].buf)
+        return from_array(out, minx + 1, miny + 1)
+
+    step.close = teardown  # type: ignore[attr-defined]
+    return step
+
+# Cython-Variante: C-kompilierter Kernel ohne jeglichen Interpreter-Overhead
+def step_func_cython(rule: Rule) -> Callable[[Alive], Alive]:
+    """
+    Wie step_func_jit, aber mit dem vorab kompilierten Cython-Kernel aus
+    gol_kernel.pyx. Ist das Modul nicht gebaut (oder die Regel unbekannt),
+    wird transparent der Numba-/NumPy-Pfad verwendet.
+    """
+    rule_id = _RULE_IDS.get(rule)
+    if _gol_kernel is None or rule_id is None:
+        return step_func_jit(rule)
+
+    def step(alive: Alive) -> Alive:
+        if not alive:
+            return alive
+        arr, minx, miny = to_array(alive)  # äußerer Ring = fertiges Halo
+        out = np.empty((arr.shape[0] - 2, arr.shape[1] - 2), dtype=np.uint8)
+        _gol_kernel.step(arr, out, rule_id)
+        return from_array(out, minx + 1, miny + 1)
+    return step
+
+# Bit-gepackte Variante: 64 Spalten pro uint64-Wort, Nachbarsumme als SWAR-Volladdierer
+_ONE = np.uint64(1)
+_S63 = np.uint64(63)
+
+def pack_array(arr: np.ndarray) -> np.ndarray:
+    """Packt ein uint8-Array (H, W) zeilenweise in uint64-Worte (H, ceil(W/64)).
+    Bit (x % 64) von Wort x // 64 entspricht Spalte x (LSB = kleinste Spalte)."""
+    h, w = arr.shape
+    n_words = -(-w // 64)
+    padded = np.zeros((h, n_words * 64), dtype=np.uint8)
+    padded[:, :w] = arr != 0
+    bits = padded.reshape(h, n_words, 8, 8)
+    # np.packbits füllt MSB-first; pro Byte umdrehen und Bytes little-endian lesen
+    packed = np.packbits(bits[:, :, :, ::-1], axis=-1).reshape(h, n_words, 8)
+    return packed.view(np.uint64).reshape(h, n_words)
+
+def unpack_array(packed: np.ndarray, width: int) -> np.ndarray:
+    """Inverse zu pack_array: (H, n_words) uint64 zurück in ein uint8-Array (H, width)."""
+    h = packed.shape[0]
+    as_bytes = packed.view(np.uint8).reshape(h, -1, 8)
+    bits = np.unpackbits(as_bytes, axis=-1).reshape(h, -1, 8, 8)[:, :, :, ::-1]
+    return bits.reshape(h, -1)[:, :width].astype(np.uint8)
+
+def _shift_west(p: np.ndarray, width: int, wrap: bool) -> np.ndarray:
+    """Bit c des Ergebnisses = Bit c-1 von p (Westnachbar), Übertrag über Wortgrenzen."""
+    out = p << _ONE
+    out[:, 1:] |= p[:, :-1] >> _S63
+    if wrap:
+        out[:, 0] |= (p[:, -1] >> np.uint64((width - 1) % 64)) & _ONE
+    return out
+
+def _shift_east(p: np.ndarray, width: int, wrap: bool) -> np.ndarray:
+    """Bit c des Ergebnisses = Bit c+1 von p (Ostnachbar), Übertrag über Wortgrenzen."""
+    out = p >> _ONE
+    out[:, :-1] |= p[:, 1:] << _S63
+    if wrap:
+        out[:, -1] |= (p[:, 0] & _ONE) << np.uint64((width - 1) % 64)
+    return out
+
+def _row_sum3(l: np.ndarray, c: np.ndarray, r: np.ndarray):
+    """Volladdierer über drei 1-Bit-Operanden: (Summenbit, Übertragsbit)."""
+    return l ^ c ^ r, (l & c) | (r & (l ^ c))
+
+def _conway_bits(b0, b1, b2, alive):
+    return b1 & ~b2 & (b0 | alive)
+
+def _highlife_bits(b0, b1, b2, alive):
+    # Zusatzterm n == 6 (Bitmuster 110) gemäß highlife_rule
+    return (b1 & ~b2 & (b0 | alive)) | (b2 & b1 & ~b0)
+
+_PACKED_KERNELS: Dict[Rule, Callable] = {
+    conway_rule: _conway_bits,
+    highlife_rule: _highlife_bits,
+}
+
+def _step_packed(p: np.ndarray, width: int, kernel, wrap: bool) -> np.ndarray:
+    h, n_words = p.shape
+    # Zeilennachbarn ausrichten: top[y] = p[y-1], bot[y] = p[y+1]
+    top = np.zeros_like(p)
+    bot = np.zeros_like(p)
+    top[1:] = p[:-1]
+    bot[:-1] = p[1:]
+    if wrap:
+        top[0] = p[-1]
+        bot[-1] = p[0]
+
+    # Pro Nachbarzeile die 2-Bit-Zeilensumme (oben/unten: L+C+R, Mitte: nur L+R)
+    st, ct = _row_sum3(_shift_west(top, width, wrap), top, _shift_east(top, width, wrap))
+    sb, cb = _row_sum3(_shift_west(bot, width, wrap), bot, _shift_east(bot, width, wrap))
+    lm = _shift_west(p, width, wrap)
+    rm = _shift_east(p, width, wrap)
+    sm, cm = lm ^ rm, lm & rm
+
+    # Drei Summen- und drei Übertragsbits zu den Bits b0..b2 der 0..8-Summe kombinieren
+    b0 = st ^ sb ^ sm
+    e1 = (st & sb) | (sm & (st ^ sb))
+    f1 = ct ^ cb ^ cm
+    g2 = (ct & cb) | (cm & (ct ^ cb))
+    b1 = e1 ^ f1
+    b2 = g2 ^ (e1 & f1)
+
+    nxt = kernel(b0, b1, b2, p)
+    # Bits jenseits der Grid-Breite im letzten Wort tot halten
+    tail = width % 64
+    if tail:
+        nxt[:, -1] &= (_ONE << np.uint64(tail)) - _ONE
+    return nxt
+
+def step_packed(packed: np.ndarray, width: int, rule: Rule = conway_rule) -> np.ndarray:
+    """
+    Ein Schritt auf dem bit-gepackten Grid (begrenzt, Rand tot): die
+    Nachbarsumme wird als SWAR-Volladdierer bitparallel über 64 Spalten
+    pro Wort berechnet, ganz ohne per-Zellen-Logik.
+    """
+    kernel = _PACKED_KERNELS.get(rule)
+    if kernel is None:
+        raise ValueError("Keine gepackte Kernel-Variante für diese Regel registriert.")
+    if _gol_simd is not None:
+        # AVX2-Pfad: gleicher Volladdierer, aber 4 Worte pro Instruktion
+        p = np.ascontiguousarray(packed, dtype=np.uint64)
+        out = np.empty_like(p)
+        _gol_simd.step(p, out, p.shape[0], p.shape[1], width, _RULE_IDS[rule])
+        return out
+    return _step_packed(packed, width, kernel, wrap=False)
+
+def step_packed_torus(packed: np.ndarray, width: int, rule: Rule = conway_rule) -> np.ndarray:
+    """Wie step_packed, aber mit Torus-Topologie (Zeilen und Spalten wickeln um)."""
+    kernel = _PACKED_KERNELS.get(rule)
+    if kernel is None:
+        raise ValueError("Keine gepackte Kernel-Variante für diese Regel registriert.")
+    return _step_packed(packed, width, kernel, wrap=True)
+
+def step_func_packed(rule: Rule) -> Callable[[Alive], Alive]:
+    """Adapter auf die Alive-Set-API: packt pro Schritt die Bounding Box + Halo."""
+    if rule not in _PACKED_KERNELS:
+        return step_func(rule)
+
+    def step(alive: Alive) -> Alive:
+        if not alive:
+            return alive
+        arr, minx, miny = to_array(alive)
+        packed = pack_array(arr)
+        nxt = step_packed(packed, arr.shape[1], rule)
+        return from_array(unpack_array(nxt, arr.shape[1]), minx, miny)
+    return step
+
+# GPU-Variante: derselbe Slice-Kernel, aber auf CuPy-Arrays im Device-Speicher
+def step_func_cuda(rule: Rule) -> Callable[[Alive], Alive]:
+    """
+    Wie step_func_numpy, aber Nachbarsumme und Regel laufen als
+    CuPy-Elementwise-Kernels auf der GPU; _neighbor_counts_inner und die
+    Regel-Kernels sind array-agnostisch und funktionieren unverändert auf
+    Device-Arrays. Der Eingabepuffer wird zwischen Schritten gleicher
+    Bounding-Box-Größe wiederverwendet. Ohne CuPy oder ohne GPU wird
+    transparent der CPU-Pfad (Numba/NumPy) verwendet.
+    """
+    kernel = _ARRAY_KERNELS.get(rule)
+    if _cp is None or kernel is None:
+        return step_func_jit(rule)
+    state: dict = {"shape": None, "cur": None}
+
+    def step(alive: Alive) -> Alive:
+        if not alive:
+            return alive
+        arr, minx, miny = to_array(alive)
+        if state["shape"] != arr.shape:
+            state["cur"] = _cp.empty(arr.shape, dtype=_cp.uint8)
+            state["shape"] = arr.shape
+        cur = state["cur"]
+        cur.set(arr)
+        n = _neighbor_counts_inner(cur)
+        nxt = kernel(cur[1:-1, 1:-1].astype(_cp.bool_), n)
+        return from_array(_cp.asnumpy(nxt), minx + 1, miny + 1)
+    return step
+
+# Begrenztes Grid (dichte Darstellung): flaches uint8-Array, 1 Byte pro Zelle
+# statt geboxter Python-Bools; Rand gilt als tot.
+_GRID_TABLE = bytes.maketrans(b"\x00\x01", b".#")
+
+def grid_from_strings(lines: List[str], live_char: str = "#") -> np.ndarray:
+    """ASCII-Muster -> uint8-Grid der Form (H, W)."""
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    width = max(map(len, lines))
+    if width == 0:
+        return np.zeros((len(lines), 0), dtype=np.uint8)
+    blob = "".join(row.ljust(width) for row in lines).encode("latin-1")
+    arr = np.frombuffer(blob, dtype="S1").reshape(len(lines), width)
+    return (arr == live_char.encode("latin-1")).astype(np.uint8)
+
+def step_grid(grid: np.ndarray, rule: Rule = conway_rule) -> np.ndarray:
+    """Ein Schritt auf dem begrenzten Grid (Zellen außerhalb sind tot)."""
+    kernel = _ARRAY_KERNELS.get(rule)
+    if kernel is None:
+        raise ValueError("Keine dichte Kernel-Variante für diese Regel registriert.")
+    n = _neighbor_counts_inner(np.pad(grid, 1))
+    return kernel(grid.astype(np.bool_), n).astype(np.uint8)
+
+def generations_grid(start: np.ndarray, rule: Rule = conway_rule) -> Iterator[np.ndarray]:
+    """
+    Wie generations, aber für das begrenzte Grid: zwei einmal allozierte,
+    gepaddete Puffer werden pro Schritt getauscht (Doppelpufferung) statt
+    pro Generation neue Arrays zu bauen; auch der Nachbarzähler wird
+    wiederverwendet. Geliefert werden schreibgeschützte Views auf den
+    jeweils aktuellen Puffer — wer den Zustand behalten will, kopiert ihn.
+    """
+    kernel = _ARRAY_KERNELS.get(rule)
+    if kernel is None:
+        raise ValueError("Keine dichte Kernel-Variante für diese Regel registriert.")
+    h, w = start.shape
+    cur = np.zeros((h + 2, w + 2), dtype=np.uint8)
+    nxt = np.zeros((h + 2, w + 2), dtype=np.uint8)
+    counts = np.empty((h, w), dtype=np.uint8)
+    cur[1:-1, 1:-1] = start
+    while True:
+        view = cur[1:-1, 1:-1].view()
+        view.flags.writeable = False
+        yield view
+        # Nachbarsumme in den persistenten Zähler akkumulieren
+        np.add(cur[:-2, :-2], cur[:-2, 1:-1], out=counts)
+        for part in (cur[:-2, 2:], cur[1:-1, :-2], cur[1:-1, 2:],
+                     cur[2:, :-2], cur[2:, 1:-1], cur[2:, 2:]):
+            np.add(counts, part, out=counts)
+        nxt[1:-1, 1:-1] = kernel(cur[1:-1, 1:-1].astype(np.bool_), counts)
+        cur, nxt = nxt, cur
+
+def display_grid(grid: np.ndarray) -> None:
+    """Gibt das Grid als ASCII-Block aus: ein translate und ein write pro
+    Frame statt einer print-Zeile (= Syscall + Lock) pro Grid-Zeile."""
+    h, w = grid.shape
+    if h == 0:
+        sys.stdout.write("\n\n")
+        return
+    frame = np.empty((h, w + 1), dtype=np.uint8)
+    frame[:, :w] = grid
+    frame[:, w] = ord("\n")  # translate lässt alle Bytes außer 0/1 unverändert
+    sys.stdout.write(frame.tobytes().translate(_GRID_TABLE).decode("latin-1") + "\n")
+
 # Parsing & Anzeige (Ausschnitt automatisch via Bounding Box)
 def alive_from_strings(lines: List[str], origin: Cell = (0, 0), live_char: str = "#") -> Alive:
     ox, oy = origin
-    return frozenset(
-        (ox + x, oy + y)
-        for y, row in enumerate(lines)
-        for x, ch in enumerate(row)
-        if ch == live_char
-    )
+    if not lines:
+        return frozenset()
+    # Zeilen auf gleiche Länge bringen und als Byte-Matrix vergleichen:
+    # ein C-Vergleich über alle Zeichen statt einer Python-Schleife pro Zeichen
+    width = max(map(len, lines))
+    if width == 0:
+        return frozenset()
+    blob = "".join(row.ljust(width) for row in lines).encode("latin-1")
+    arr = np.frombuffer(blob, dtype="S1").reshape(len(lines), width)
+    ys, xs = np.nonzero(arr == live_char.encode("latin-1"))
+    return frozenset(zip((xs + ox).tolist(), (ys + oy).tolist()))
+
+# 1-Slot-Cache für bbox: display/to_array fragen dieselbe (unveränderliche)
+# Menge oft mehrfach an; die Referenz hält das Set am Leben, daher ist der
+# Identitätsvergleich sicher.
+_bbox_cache: dict = {"alive": None, "result": None}
 
 def bbox(alive: Alive, pad: int = 1) -> Tuple[int, int, int, int]:
-    xs = [x for x, _ in alive]
-    ys = [y for _, y in alive]
-    return (min(xs) - pad, max(xs) + pad, min(ys) - pad, max(ys) + pad)
+    if not alive:
+        raise ValueError("bbox eines leeren Alive-Sets ist nicht definiert")
+    if _bbox_cache["alive"] is alive:
+        minx, maxx, miny, maxy = _bbox_cache["result"]
+    else:
+        # Ein Durchlauf mit vier Akkumulatoren statt zweier Zwischenlisten
+        it = iter(alive)
+        x, y = next(it)
+        minx = maxx = x
+        miny = maxy = y
+        for x, y in it:
+            if x < minx:
+                minx = x
+            elif x > maxx:
+                maxx = x
+            if y < miny:
+                miny = y
+            elif y > maxy:
+                maxy = y
+        _bbox_cache["alive"] = alive
+        _bbox_cache["result"] = (minx, maxx, miny, maxy)
+    return (minx - pad, maxx + pad, miny - pad, maxy + pad)
 
 def display(alive: Alive, pad: int = 2, live: str = "#", dead: str = ".") -> None:
     if not alive:
         print("(empty)\n")
         return
     minx, maxx, miny, maxy = bbox(alive, pad=pad)
-    print("\n".join(
-        "".join(live if (x, y) in alive else dead for x in range(minx, maxx + 1))
-        for y in range(miny, maxy + 1)
-    ))
-    print()
+    # Frame als Byte-Matrix aufbauen (letzte Spalte = Zeilenumbruch) und in
+    # einem einzigen write ausgeben — keine H*W Set-Lookups, keine print-Syscalls
+    h, w = maxy - miny + 1, maxx - minx + 1
+    frame = np.full((h, w + 1), ord(dead), dtype=np.uint8)
+    frame[:, -1] = ord("\n")
+    xs = np.fromiter((x for x, _ in alive), dtype=np.intp, count=len(alive))
+    ys = np.fromiter((y for _, y in alive), dtype=np.intp, count=len(alive))
+    frame[ys - miny, xs - minx] = ord(live)
+    sys.stdout.write(frame.tobytes().decode("latin-1") + "\n")
 
 # Demo
 def main() -> None:
@@ -90,12 +707,21 @@ def main() -> None:
 
     rule = conway_rule          # oder: highlife_rule
     step = step_func(rule)
-    gen = generations(alive0, step)
 
-    for i in range(50):
-        print(f"Generation {i}:")
-        display(next(gen), pad=2)
-        time.sleep(0.5)
+    # Berechnung und Anzeige überlappen: während der aktuelle Frame gezeigt
+    # wird, rechnet der Worker bereits die nächste Generation. Die monotone
+    # Deadline verhindert, dass sich Schlaf- und Rechenzeitdrift aufsummiert.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        current = alive0
+        future = ex.submit(step, current)
+        deadline = time.monotonic()
+        for i in range(50):
+            print(f"Generation {i}:")
+            display(current, pad=2)
+            deadline += 0.5
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            current = future.result()
+            future = ex.submit(step, current)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,29 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Kompilierter Step-Kernel für game_of_life (optional).
+
+Bauen mit:  python setup.py build_ext --inplace
+Ohne das gebaute Modul fällt game_of_life.step_func_cython auf den
+Numba- bzw. NumPy-Pfad zurück.
+"""
+
+
+def step(const unsigned char[:, ::1] padded, unsigned char[:, ::1] out, int rule):
+    """
+    Ein Schritt über das 1-fach gepaddete uint8-Grid; out hat die
+    ungepaddete Form. rule: 0 = Conway, 1 = HighLife.
+    """
+    cdef Py_ssize_t h = out.shape[0]
+    cdef Py_ssize_t w = out.shape[1]
+    cdef Py_ssize_t x, y
+    cdef int n, alive
+    for y in range(h):
+        for x in range(w):
+            n = (padded[y, x] + padded[y, x + 1] + padded[y, x + 2]
+                 + padded[y + 1, x] + padded[y + 1, x + 2]
+                 + padded[y + 2, x] + padded[y + 2, x + 1] + padded[y + 2, x + 2])
+            alive = padded[y + 1, x + 1]
+            if rule == 0:
+                out[y, x] = 1 if (n == 3 or (alive and n == 2)) else 0
+            else:
+                out[y, x] = 1 if (n == 3 or n == 6 or (alive and n == 2)) else 0
@@ -1,24 +1,92 @@
 # für komplexe Typannotationen
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 # ermöglicht exakte Dezimal-Arithmetik
+from collections import deque
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime
-from typing import Optional, Dict, List, Callable, Type
+from enum import Enum
+from itertools import islice
+import sys
+import time
+from typing import Deque, Optional, Dict, List, Callable, Type
+
+# NumPy ist optional: nur der vektorisierte Zinslauf nutzt es, der
+# skalare Pfad funktioniert ohne
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
+# Ab so vielen Sparkonten lohnt der vektorisierte Zinslauf
+VECTOR_INTEREST_MIN = 32
+
+# Obergrenze je Free-List für wiederverwendbare Journal-Objekte
+POOL_MAX = 4096
+
+# Numba ist ebenfalls optional: beschleunigt nur das Verbuchen der Legs
+try:
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover
+    _njit = None
+
+
+def _post_leg(balances, idx: int, delta: int) -> int:
+    """Saldo-Update eines Buchungs-Legs auf dem gemeinsamen Cents-Array."""
+    balances[idx] += delta
+    return balances[idx]
+
+
+if _njit is not None and _np is not None:
+    _post_leg = _njit(cache=True)(_post_leg)
 
 # für Geldbeträge sinnvolle Rundung setzen
 CENTS = Decimal("0.01")
 
+# geteilte Konstante statt money(0)-Konstruktion pro Aufruf
+ZERO = Decimal("0.00")
+
 
 def money(x) -> Decimal:
     """
     Normalisiert Eingaben zuverlässig auf 2 Dezimalstellen.
     Erlaubt Int/Str/Decimal als Argument.
     """
-    if not isinstance(x, Decimal):
+    # Decimal/int direkt konstruieren; der str(x)-Umweg (formatieren +
+    # zurückparsen) bleibt nur für float (vermeidet Binär-Artefakte) und str
+    t = type(x)
+    if t is Decimal:
+        return x.quantize(CENTS, rounding=ROUND_HALF_UP)
+    if t is int:
+        return Decimal(x).quantize(CENTS, rounding=ROUND_HALF_UP)
+    return Decimal(str(x)).quantize(CENTS, rounding=ROUND_HALF_UP)
+
+
+# Interne Betragsdarstellung: ganzzahlige Cents statt Decimal.
+# Eine Buchung ist damit eine einzelne Integer-Addition; Decimal existiert
+# nur noch an der API-Grenze (Ein-/Ausgabe).
+def _to_cents(x) -> int:
+    """Beliebige money()-kompatible Eingabe -> ganzzahlige Cents (HALF_UP)."""
+    t = type(x)
+    if t is int:
+        return x * 100  # häufigster API-Fall: ganze Beträge
+    if t is not Decimal:
         x = Decimal(str(x))
-    return x.quantize(CENTS, rounding=ROUND_HALF_UP)
+    return int(x.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_cents(c: int) -> Decimal:
+    """Ganzzahlige Cents -> Decimal mit 2 Nachkommastellen."""
+    if not c:
+        return ZERO  # häufigster Fall (leere Konten, gebührenfreie Typen)
+    return Decimal(c).scaleb(-2)
+
+
+def _journal_tail(journal: deque, limit: Optional[int]) -> list:
+    """Letzte 'limit' Einträge (bzw. alle) als Liste, ohne Voll-Kopie + Slice."""
+    if limit is not None and limit >= 0:
+        return list(islice(journal, max(0, len(journal) - limit), None))
+    return list(journal)
 
 
 # Exceptions, klare Fehlerfälle signalisieren
@@ -50,8 +118,24 @@ class SameAccountTransfer(BankError):
     """Überweisung von und zu demselben Konto nicht erlaubt (optional)."""
 
 
-# Datenstrukturen für Journal/Transaktionen 
-@dataclass(frozen=True)
+class TxnType(str, Enum):
+    """
+    Transaktionsarten als Enum: intern genügt ein Identitätsvergleich
+    (einzelne Member-Objekte), nach aussen verhalten sich die Werte wie die
+    bisherigen Strings ('txn.type == "TRANSFER"' bleibt gültig).
+    """
+    CASH_DEPOSIT = "CASH_DEPOSIT"
+    TRANSFER = "TRANSFER"
+    FEE = "FEE"
+    INTEREST = "INTEREST"
+
+    __str__ = str.__str__  # formatiert als Wert, nicht als "TxnType.X"
+
+
+# Datenstrukturen für Journal/Transaktionen
+# Bewusst schlanke __slots__-Klassen statt (frozen) dataclasses: kein
+# __dict__ pro Objekt und kein object.__setattr__-Umweg bei der Konstruktion —
+# pro Buchung werden mehrere dieser Objekte erzeugt.
 class Transaction:
     """
     Repräsentiert eine Bank-Transaktion für das Bank-Journal.
@@ -61,17 +145,32 @@ class Transaction:
       - "FEE":          Gebührentransfer (von Kunde -> Bank)
       - "INTEREST":     Zinsgutschrift (von Bank -> Kunde)
     """
-    id: int
-    sequence: int                      # monoton steigende Nummer, Reihenfolge
-    ts_utc: datetime                   # Zeitstempel
-    type: str                          # Art der Transaktion
-    from_account: Optional[str]        # Bel.-Konto, None bei Bareinzahlung
-    to_account: Optional[str]          # Gut.-Konto, bei Bareinzahlung = Zielkonto
-    amount: Decimal                    # immer positiv, Buchungswert
-    purpose: Optional[str] = None      # Verwendungszweck/Notiz
+    __slots__ = ("id", "sequence", "ts_ns", "type",
+                 "from_account", "to_account", "amount_cents", "purpose")
+
+    def __init__(self, id: int, sequence: int, ts_ns: int, type: str,
+                 from_account: Optional[str], to_account: Optional[str],
+                 amount_cents: int, purpose: Optional[str] = None):
+        self.id = id
+        self.sequence = sequence                # monoton steigende Nummer, Reihenfolge
+        self.ts_ns = ts_ns                      # Zeitstempel (Unix-Epoche, Nanosekunden)
+        self.type = type                        # Art der Transaktion
+        self.from_account = from_account        # Bel.-Konto, None bei Bareinzahlung
+        self.to_account = to_account            # Gut.-Konto, bei Bareinzahlung = Zielkonto
+        self.amount_cents = amount_cents        # immer positiv, Buchungswert in Cents
+        self.purpose = purpose                  # Verwendungszweck/Notiz
+
+    @property
+    def ts_utc(self) -> datetime:
+        """Zeitstempel als datetime (lazy, nur bei Bedarf konstruiert)."""
+        return datetime.utcfromtimestamp(self.ts_ns / 1e9)
+
+    @property
+    def amount(self) -> Decimal:
+        """Buchungswert als Decimal (API-Grenze)."""
+        return _from_cents(self.amount_cents)
 
 
-@dataclass(frozen=True)
 class AccountEntry:
     """
     Ein Eintrag im Konto-Journal eines einzelnen Kontos.
@@ -81,13 +180,29 @@ class AccountEntry:
     counterparty:
       - Konto-ID der Gegenseite (oder None bei Bareinzahlung)
     """
-    transaction_id: int
-    sequence: int
-    ts_utc: datetime
-    type: str
-    amount_signed: Decimal
-    counterparty: Optional[str]
-    purpose: Optional[str]
+    __slots__ = ("transaction_id", "sequence", "ts_ns", "type",
+                 "amount_signed_cents", "counterparty", "purpose")
+
+    def __init__(self, transaction_id: int, sequence: int, ts_ns: int,
+                 type: str, amount_signed_cents: int,
+                 counterparty: Optional[str], purpose: Optional[str]):
+        self.transaction_id = transaction_id
+        self.sequence = sequence
+        self.ts_ns = ts_ns
+        self.type = type
+        self.amount_signed_cents = amount_signed_cents
+        self.counterparty = counterparty
+        self.purpose = purpose
+
+    @property
+    def ts_utc(self) -> datetime:
+        """Zeitstempel als datetime (lazy, nur bei Bedarf konstruiert)."""
+        return datetime.utcfromtimestamp(self.ts_ns / 1e9)
+
+    @property
+    def amount_signed(self) -> Decimal:
+        """Signierter Buchungswert als Decimal (API-Grenze)."""
+        return _from_cents(self.amount_signed_cents)
 
 
 # Konto-Hierarchie
@@ -103,8 +218,13 @@ class Account:
     def __init__(self, account_id: str):
         self._id: str = account_id
         self._active: bool = True
-        self._balance: Decimal = money(0)
-        self._journal: List[AccountEntry] = []
+        self._balance_cents: int = 0
+        # deque statt list: O(1)-Append ohne Überallokation, Tail-Reads via islice
+        self._journal: Deque[AccountEntry] = deque()
+        # Von der Bank beim Registrieren gesetzt: Slot im gemeinsamen
+        # int64-Saldenarray (JIT-Pfad); -1 = nicht angebunden
+        self._bank: Optional["Bank"] = None
+        self._bal_idx: int = -1
 
     # Eigenschaften, nur lesend von aussen zugänglich
     @property
@@ -117,16 +237,16 @@ class Account:
 
     @property
     def balance(self) -> Decimal:
-        return self._balance
+        return _from_cents(self._balance_cents)
 
     @property
     def journal(self) -> List[AccountEntry]:
         # Kopie zurückgeben, um Encapsulation zu wahren
         return list(self._journal)
 
-    # Lebenszyklus 
+    # Lebenszyklus
     def close(self):
-        if self._balance != money(0):
+        if self._balance_cents != 0:
             raise BankError("Konto kann nur mit Saldo 0 geschlossen werden.")
         self._active = False
 
@@ -134,24 +254,38 @@ class Account:
     def _post(self, entry: AccountEntry):
         """Nur von der Bank aufrufen: Journal-Eintrag hinzufügen und Saldo anpassen."""
         self._journal.append(entry)
-        self._balance = money(self._balance + entry.amount_signed)
+        if self._bal_idx >= 0:
+            # JIT-Pfad: Update auf dem Saldenarray der Bank; der lokale
+            # Spiegel bleibt gültig, damit Regelprüfungen ein plain int lesen
+            self._balance_cents = int(_post_leg(
+                self._bank._balances, self._bal_idx, entry.amount_signed_cents))
+        else:
+            self._balance_cents += entry.amount_signed_cents
 
     #  Regeln, Polymorphie
+    # Die *_cents-Varianten sind die eigentliche Implementierung (heißer Pfad der
+    # Bank); die Decimal-Methoden bleiben als öffentliche Fassade erhalten.
     def can_withdraw(self, amount: Decimal) -> bool:
         """
         Prüft, ob dieser Kontotyp einen Abgang 'amount' zulässt.
         Basis: kein Überzug erlaubt (nicht negativ).
         """
-        if amount <= 0:
+        return self._can_withdraw_cents(_to_cents(amount))
+
+    def _can_withdraw_cents(self, amount_cents: int) -> bool:
+        if amount_cents <= 0:
             return False
-        return self._balance - amount >= money(0)
+        return self._balance_cents - amount_cents >= 0
 
     def calc_withdraw_fee(self, amount: Decimal) -> Decimal:
         """
         Berechnet die Gebühr für eine Abbuchung (Standard: 0).
         Positive Decimal zurückgeben.
         """
-        return money(0)
+        return _from_cents(self._calc_withdraw_fee_cents(_to_cents(amount)))
+
+    def _calc_withdraw_fee_cents(self, amount_cents: int) -> int:
+        return 0
 
     def accrue_interest(self, bank: "Bank") -> Optional[Transaction]:
         """
@@ -188,22 +322,39 @@ class PrivateAccount(Account):
                  min_fee: Decimal = money("0.50")):
         super().__init__(account_id)
         self._overdraft_limit = money(overdraft_limit)
-        self._fee_percent = Decimal(fee_percent)   
+        self._fee_percent = Decimal(fee_percent)
         self._min_fee = money(min_fee)
+        # Cents-Äquivalente für den heißen Pfad
+        self._overdraft_limit_cents = _to_cents(self._overdraft_limit)
+        self._min_fee_cents = _to_cents(self._min_fee)
+        # Gebührenformel als Closure mit eingebackenen Konstanten: ist die
+        # Rate exakt in Basispunkten darstellbar, rechnet der heiße Pfad rein
+        # ganzzahlig ((amt*n + 5000) // 10000 == HALF_UP); sonst Decimal-Pfad
+        fee_bps = self._fee_percent.scaleb(4)
+        if fee_bps == int(fee_bps):
+            n = int(fee_bps)
+            m = self._min_fee_cents
+            self._fee_cents_fn = lambda amount_cents, _n=n, _m=m: (
+                max(_m, (amount_cents * _n + 5000) // 10000))
+        else:
+            pct = self._fee_percent
+            m = self._min_fee_cents
+            self._fee_cents_fn = lambda amount_cents, _p=pct, _m=m: max(
+                _m, int((amount_cents * _p).to_integral_value(rounding=ROUND_HALF_UP)))
 
     def describe(self) -> str:
         return (f"Private Account (overdraft to -{self._overdraft_limit}, "
                 f"fee={self._fee_percent*100:.2f}% min {self._min_fee})")
 
-    def can_withdraw(self, amount: Decimal) -> bool:    # polymorpher Hook
-        if amount <= 0:
+    def _can_withdraw_cents(self, amount_cents: int) -> bool:    # polymorpher Hook
+        if amount_cents <= 0:
             return False
         # Überziehung bis -limit erlaubt
-        return self.balance - amount >= money(0) - self._overdraft_limit
+        return self._balance_cents - amount_cents >= -self._overdraft_limit_cents
 
-    def calc_withdraw_fee(self, amount: Decimal) -> Decimal:
-        raw = money(amount * self._fee_percent)
-        return raw if raw >= self._min_fee else self._min_fee
+    def _calc_withdraw_fee_cents(self, amount_cents: int) -> int:
+        # delegiert an die in __init__ gebaute Closure (Konstanten vorgebunden)
+        return self._fee_cents_fn(amount_cents)
 
 
 class SavingsAccount(Account):
@@ -216,25 +367,34 @@ class SavingsAccount(Account):
     def __init__(self, account_id: str, rate_per_period: Decimal = Decimal("0.01")):
         super().__init__(account_id)
         self._rate = Decimal(rate_per_period)  # 1% pro Periode als Default
+        # Rate als exakte Ganzzahl in "parts per million", falls darstellbar;
+        # sonst None -> Konto nimmt nur am skalaren Decimal-Zinslauf teil
+        rate_ppm = self._rate.scaleb(6)
+        self._rate_ppm: Optional[int] = int(rate_ppm) if rate_ppm == int(rate_ppm) else None
 
     def describe(self) -> str:
         pct = self._rate * 100
         return f"Savings Account (no overdraft, interest {pct:.2f}%/period)"
 
+    def _interest_purpose(self) -> str:
+        # interniert: derselbe Zwecktext fällt pro Periode und Konto erneut an
+        return sys.intern(f"Interest @ {self._rate * 100:.2f}%")
+
     def accrue_interest(self, bank: "Bank") -> Optional[Transaction]:
         # Zins nur gutschreiben, wenn positiver Saldo vorhanden ist
-        if self.balance <= money(0):
+        if self._balance_cents <= 0:
             return None
-        interest = money(self.balance * self._rate)
-        if interest == money(0):
+        interest_cents = int((self._balance_cents * self._rate)
+                             .to_integral_value(rounding=ROUND_HALF_UP))
+        if interest_cents == 0:
             return None
         # Zinsbuchung: von Bank-ZINSKONTO -> dieses Konto
         return bank._book_internal_transfer(
             from_internal=bank.interest_expense_account_id,
             to_account=self.id,
-            amount=interest,
-            type_="INTEREST",
-            purpose=f"Interest @ {self._rate * 100:.2f}%"
+            amount_cents=interest_cents,
+            type_=TxnType.INTEREST,
+            purpose=self._interest_purpose()
         )
 
 
@@ -267,20 +427,51 @@ class Bank:
                  interest_expense_account_id: str = "BANK:INTEREST_EXPENSE"):
         # Kontenindex
         self._accounts: Dict[str, Account] = {}
+        # Sekundärindex: nur Sparkonten, damit die Zinsperiode nicht alle
+        # Konten scannen und isinstance-testen muss (O(K) statt O(N))
+        self._savings_accounts: List[SavingsAccount] = []
+
+        # Gemeinsames int64-Saldenarray für den JIT-Buchungspfad;
+        # ohne NumPy buchen Konten auf ihren lokalen Python-int
+        self._balances = _np.zeros(64, dtype=_np.int64) if _np is not None else None
+        self._next_bal_idx = 0
 
         # Bankjournal
-        self._journal: List[Transaction] = []
+        self._journal: Deque[Transaction] = deque()
         self._next_txn_id = 1
         self._sequence = 1  # globaler Reihenfolgezähler
 
+        # Free-Lists: via _retire_before ausrangierte Journal-Objekte werden
+        # bei der nächsten Buchung wiederverwendet statt neu alloziert
+        self._txn_pool: List[Transaction] = []
+        self._entry_pool: List[AccountEntry] = []
+
+        # Invarianten werden beim Verbuchen geprüft; audit() liest nur das Flag
+        self._audit_ok: bool = True
+
         # Registry: string -> factory(account_id, **kwargs) -> Account
         self._account_type_registry: Dict[str, Callable[..., Account]] = {}
 
+        # Devirtualisierung: Kontoklasse -> (fee_fn, check_fn) als ungebundene
+        # Funktionen; transfer macht damit einen Dict-Lookup statt zweier
+        # Methoden-Lookups pro Buchung. Unbekannte Subklassen werden beim
+        # ersten Treffer lazy ergänzt, ein 1-Slot-Cache fängt monomorphe
+        # Lastprofile ab (fast immer derselbe Kontotyp).
+        self._rules: Dict[type, tuple] = {
+            cls: (cls._calc_withdraw_fee_cents, cls._can_withdraw_cents)
+            for cls in (YouthAccount, PrivateAccount, SavingsAccount,
+                        InternalBankAccount)
+        }
+        self._rules_last_type: Optional[type] = None
+        self._rules_last_pair: Optional[tuple] = None
+
         # Interne Bankkonten erzeugen
         self.fee_income_account_id = fee_income_account_id
         self.interest_expense_account_id = interest_expense_account_id
         self._accounts[fee_income_account_id] = InternalBankAccount(fee_income_account_id)
         self._accounts[interest_expense_account_id] = InternalBankAccount(interest_expense_account_id)
+        for acc in self._accounts.values():
+            self._attach_balance_slot(acc)
 
         # Nützliche Defaults registrieren
         self.register_account_type("youth", lambda account_id, **kw: YouthAccount(account_id))
@@ -298,26 +489,58 @@ class Bank:
         # Einfache Konto-ID-Automat
         self._next_account_nr = 100000
 
-    # Utility: neues Transaktionsobjekt 
+    # Utility: neues Transaktionsobjekt
     def _new_transaction(self, type_: str,
                          from_account: Optional[str],
                          to_account: Optional[str],
-                         amount: Decimal,
+                         amount_cents: int,
                          purpose: Optional[str]) -> Transaction:
-        txn = Transaction(
-            id=self._next_txn_id,
-            sequence=self._sequence,
-            ts_utc=datetime.utcnow(),
-            type=type_,
-            from_account=from_account,
-            to_account=to_account,
-            amount=money(amount),
-            purpose=purpose
-        )
+        # Strings von externen Aufrufern auf das geteilte Member normalisieren
+        if type_.__class__ is not TxnType:
+            type_ = TxnType(type_)
+        pool = self._txn_pool
+        if pool:
+            txn = pool.pop()
+            txn.id = self._next_txn_id
+            txn.sequence = self._sequence
+            txn.ts_ns = time.time_ns()
+            txn.type = type_
+            txn.from_account = from_account
+            txn.to_account = to_account
+            txn.amount_cents = amount_cents
+            txn.purpose = purpose
+        else:
+            txn = Transaction(
+                id=self._next_txn_id,
+                sequence=self._sequence,
+                ts_ns=time.time_ns(),
+                type=type_,
+                from_account=from_account,
+                to_account=to_account,
+                amount_cents=amount_cents,
+                purpose=purpose
+            )
         self._next_txn_id += 1
         self._sequence += 1
         return txn
 
+    def _new_entry(self, transaction_id: int, sequence: int, ts_ns: int,
+                   type: str, amount_signed_cents: int,
+                   counterparty: Optional[str], purpose: Optional[str]) -> AccountEntry:
+        pool = self._entry_pool
+        if pool:
+            entry = pool.pop()
+            entry.transaction_id = transaction_id
+            entry.sequence = sequence
+            entry.ts_ns = ts_ns
+            entry.type = type
+            entry.amount_signed_cents = amount_signed_cents
+            entry.counterparty = counterparty
+            entry.purpose = purpose
+            return entry
+        return AccountEntry(transaction_id, sequence, ts_ns, type,
+                            amount_signed_cents, counterparty, purpose)
+
     def _append_to_journal_and_post(self, txn: Transaction):
         """
         Führt die Verbuchung durch:
@@ -327,46 +550,62 @@ class Bank:
         """
         self._journal.append(txn)
 
+        # Felder einmal in Locals heben: beide Legs lesen danach nur LOAD_FAST
+        txn_id = txn.id
+        sequence = txn.sequence
+        ts_ns = txn.ts_ns
+        type_ = txn.type
+        amount_cents = txn.amount_cents
+        purpose = txn.purpose
+        from_id = txn.from_account
+        to_id = txn.to_account
+
         # Bareinzahlung: nur Zielkonto bekommt eine Gutschrift
-        if txn.type == "CASH_DEPOSIT":
-            to_acc = self._accounts[txn.to_account]  # type: ignore
-            to_acc._post(AccountEntry(
-                transaction_id=txn.id,
-                sequence=txn.sequence,
-                ts_utc=txn.ts_utc,
-                type=txn.type,
-                amount_signed=money(+txn.amount),
+        # (Identitätsvergleich: _new_transaction normalisiert auf TxnType)
+        if type_ is TxnType.CASH_DEPOSIT:
+            if from_id is not None or to_id is None:
+                self._audit_ok = False
+                raise BankError(f"Inkonstistente CASH_DEPOSIT #{txn_id}")
+            to_acc = self._accounts[to_id]  # type: ignore
+            to_acc._post(self._new_entry(
+                transaction_id=txn_id,
+                sequence=sequence,
+                ts_ns=ts_ns,
+                type=type_,
+                amount_signed_cents=+amount_cents,
                 counterparty=None,
-                purpose=txn.purpose
+                purpose=purpose
             ))
             return
 
         # Normalfall: Transfer/Fee/Interest => zwei Konto-Einträge
-        if txn.from_account is None or txn.to_account is None:
+        if from_id is None or to_id is None:
+            self._audit_ok = False
             raise BankError("Ungültige Transaktion: from/to darf hier nicht None sein.")
 
-        from_acc = self._accounts[txn.from_account]
-        to_acc = self._accounts[txn.to_account]
-
-        # Belastung auf from
-        from_acc._post(AccountEntry(
-            transaction_id=txn.id,
-            sequence=txn.sequence,
-            ts_utc=txn.ts_utc,
-            type=txn.type,
-            amount_signed=money(-txn.amount),
-            counterparty=to_acc.id,
-            purpose=txn.purpose
+        from_acc = self._accounts[from_id]
+        to_acc = self._accounts[to_id]
+
+        # Belastung auf from; counterparty direkt aus der Transaktion
+        # (bereits Strings, spart die acc.id-Property)
+        from_acc._post(self._new_entry(
+            transaction_id=txn_id,
+            sequence=sequence,
+            ts_ns=ts_ns,
+            type=type_,
+            amount_signed_cents=-amount_cents,
+            counterparty=to_id,
+            purpose=purpose
         ))
         # Gutschrift auf to
-        to_acc._post(AccountEntry(
-            transaction_id=txn.id,
-            sequence=txn.sequence,
-            ts_utc=txn.ts_utc,
-            type=txn.type,
-            amount_signed=money(+txn.amount),
-            counterparty=from_acc.id,
-            purpose=txn.purpose
+        to_acc._post(self._new_entry(
+            transaction_id=txn_id,
+            sequence=sequence,
+            ts_ns=ts_ns,
+            type=type_,
+            amount_signed_cents=+amount_cents,
+            counterparty=from_id,
+            purpose=purpose
         ))
 
     # Öffentliche API 
@@ -390,18 +629,26 @@ class Bank:
         if account_id in self._accounts:
             raise DuplicateAccountId(f"Konto-ID '{account_id}' existiert bereits.")
 
-        factory = self._account_type_registry.get(account_type.lower())
+        # Registry-Schlüssel sind bereits normalisiert (siehe register_account_type);
+        # .lower() nur im Fallback, falls der Aufrufer gemischt schreibt
+        registry = self._account_type_registry
+        factory = registry.get(account_type) or registry.get(account_type.lower().strip())
         if not factory:
             raise BankError(f"Unbekannter Kontotyp: {account_type!r}")
 
         account = factory(account_id, **kwargs)
         self._accounts[account_id] = account
+        self._attach_balance_slot(account)
+        if isinstance(account, SavingsAccount):
+            self._savings_accounts.append(account)
         return account_id
 
     # Konto schliessen
     def close_account(self, account_id: str) -> bool:
         account = self._get_active_account(account_id)
         account.close()
+        if isinstance(account, SavingsAccount):
+            self._savings_accounts.remove(account)
         return True
 
     # Bareinzahlung
@@ -410,15 +657,21 @@ class Bank:
         Bareinzahlung: nur positive Beträge; keine Gegenbuchung.
         Rückgabe: Transaktions-ID
         """
-        amount = money(amount)
-        if amount <= money(0):
+        amount_cents = _to_cents(amount)
+        if amount_cents <= 0:
             raise InvalidAmount("Bareinzahlung muss positiv sein.")
-        to_acc = self._get_active_account(to_account_id)
+        # Lookup + Aktiv-Check inline (heißer Pfad, siehe _get_active_account)
+        try:
+            to_acc = self._accounts[to_account_id]
+        except KeyError:
+            raise AccountNotFound(f"Konto '{to_account_id}' nicht gefunden.") from None
+        if not to_acc._active:
+            raise AccountClosed(f"Konto '{to_account_id}' ist geschlossen.")
         txn = self._new_transaction(
-            type_="CASH_DEPOSIT",
+            type_=TxnType.CASH_DEPOSIT,
             from_account=None,
-            to_account=to_acc.id,
-            amount=amount,
+            to_account=to_account_id,
+            amount_cents=amount_cents,
             purpose=purpose or "Cash deposit"
         )
         self._append_to_journal_and_post(txn)
@@ -430,29 +683,50 @@ class Bank:
         Führt eine Überweisung aus. Ggf. werden zusätzliche Gebührenbuchungen erzeugt.
         Rückgabe: Liste aller erzeugten Transaktions-IDs (Hauptbuchung + evtl. Gebühr).
         """
-        amount = money(amount)
-        if amount <= money(0):
+        amount_cents = _to_cents(amount)
+        if amount_cents <= 0:
             raise InvalidAmount("Überweisungsbetrag muss positiv sein.")
         if from_account_id == to_account_id:
             raise SameAccountTransfer("Von und zu demselben Konto ist nicht erlaubt.")
 
-        from_acc = self._get_active_account(from_account_id)
-        to_acc = self._get_active_account(to_account_id)
+        # Beide Lookups inline statt über _get_active_account: spart pro
+        # Transfer vier Methodenaufrufe plus doppelte Property-Zugriffe
+        accounts = self._accounts
+        try:
+            from_acc = accounts[from_account_id]
+            to_acc = accounts[to_account_id]
+        except KeyError as exc:
+            raise AccountNotFound(f"Konto '{exc.args[0]}' nicht gefunden.") from None
+        if not (from_acc._active and to_acc._active):
+            closed = from_account_id if not from_acc._active else to_account_id
+            raise AccountClosed(f"Konto '{closed}' ist geschlossen.")
+
+        # Regeln einmal pro Kontotyp auflösen statt pro Aufruf (Devirtualisierung)
+        cls = type(from_acc)
+        if cls is self._rules_last_type:
+            fee_fn, check_fn = self._rules_last_pair
+        else:
+            pair = self._rules.get(cls)
+            if pair is None:
+                pair = (cls._calc_withdraw_fee_cents, cls._can_withdraw_cents)
+                self._rules[cls] = pair
+            fee_fn, check_fn = pair
+            self._rules_last_type = cls
+            self._rules_last_pair = pair
 
         # Gebühren berechnen
-        fee = from_acc.calc_withdraw_fee(amount)
-        total_debit = money(amount + fee)
+        fee_cents = fee_fn(from_acc, amount_cents)
 
-        # Regelprüfung (Polymorphie)
-        if not from_acc.can_withdraw(total_debit):
+        # Regelprüfung
+        if not check_fn(from_acc, amount_cents + fee_cents):
             raise InsufficientFunds("Deckung/Limit unzureichend für Abbuchung (inkl. Gebühren).")
 
         # Haupttransaktion
         txn = self._new_transaction(
-            type_="TRANSFER",
-            from_account=from_acc.id,
-            to_account=to_acc.id,
-            amount=amount,
+            type_=TxnType.TRANSFER,
+            from_account=from_account_id,
+            to_account=to_account_id,
+            amount_cents=amount_cents,
             purpose=purpose
         )
         self._append_to_journal_and_post(txn)
@@ -460,12 +734,12 @@ class Bank:
         txn_ids = [txn.id]
 
         # Gebühren (Polymorphie): ggf. zusätzliche Transaktion von from -> BANK:FEE_INCOME
-        if fee > money(0):
+        if fee_cents > 0:
             fee_txn = self._new_transaction(
-                type_="FEE",
-                from_account=from_acc.id,
+                type_=TxnType.FEE,
+                from_account=from_account_id,
                 to_account=self.fee_income_account_id,
-                amount=fee,
+                amount_cents=fee_cents,
                 purpose=f"Fee for txn {txn.id}"
             )
             self._append_to_journal_and_post(fee_txn)
@@ -481,27 +755,51 @@ class Bank:
     # Konto-Journal abfragen
     def get_account_entries(self, account_id: str, limit: Optional[int] = None) -> List[AccountEntry]:
         acc = self._get_account(account_id)
-        entries = acc.journal
-        return entries[-limit:] if (limit is not None and limit >= 0) else entries
+        return _journal_tail(acc._journal, limit)
 
     # Bankjournal abfragen
     def get_bank_journal(self, limit: Optional[int] = None) -> List[Transaction]:
-        entries = self._journal
-        return entries[-limit:] if (limit is not None and limit >= 0) else entries
+        return _journal_tail(self._journal, limit)
 
     # Zinsen auf alle Sparkonten anwenden (eine "Periode")
     def apply_interest_to_all_savings(self) -> List[int]:
         """
-        Ruft für alle Konten accrue_interest() auf.
+        Ruft für alle aktiven Sparkonten accrue_interest() auf.
         Rückgabe: Liste erzeugter Zins-Transaktions-IDs.
         """
+        savings = self._savings_accounts
         generated: List[int] = []
-        for acc in self._accounts.values():
-            # Nur aktive "Kundenkonten" berücksichtigen (nicht interne)
-            if isinstance(acc, SavingsAccount) and acc.is_active:
-                txn = acc.accrue_interest(self)
-                if txn is not None:
-                    generated.append(txn.id)
+
+        # Vektorpfad: bei vielen Konten mit exakt darstellbaren Raten die
+        # Zinsbeträge in einem NumPy-Durchlauf berechnen (HALF_UP wie der
+        # skalare Pfad: floor(x + 0.5) für positive Salden), dann nur die
+        # Konten mit Zins > 0 verbuchen
+        if (_np is not None and len(savings) >= VECTOR_INTEREST_MIN
+                and all(acc._rate_ppm is not None for acc in savings)):
+            n = len(savings)
+            balances = _np.fromiter((acc._balance_cents for acc in savings),
+                                    dtype=_np.int64, count=n)
+            rates = _np.fromiter((acc._rate_ppm for acc in savings),
+                                 dtype=_np.int64, count=n)
+            interest = (balances * rates + 500_000) // 1_000_000
+            interest[balances <= 0] = 0
+            for idx in _np.nonzero(interest > 0)[0]:
+                acc = savings[idx]
+                txn = self._book_internal_transfer(
+                    from_internal=self.interest_expense_account_id,
+                    to_account=acc.id,
+                    amount_cents=int(interest[idx]),
+                    type_=TxnType.INTEREST,
+                    purpose=acc._interest_purpose()
+                )
+                generated.append(txn.id)
+            return generated
+
+        # Skalarer Pfad; Sekundärindex enthält genau die aktiven Sparkonten
+        for acc in savings:
+            txn = acc.accrue_interest(self)
+            if txn is not None:
+                generated.append(txn.id)
         return generated
 
     #  Open-Closed: neue Kontotypen registrieren 
@@ -513,8 +811,47 @@ class Bank:
         key = name.lower().strip()
         self._account_type_registry[key] = factory
 
-    #  interne Helfer 
-
+    #  interne Helfer
+
+    def _attach_balance_slot(self, account: Account):
+        """Weist dem Konto einen Slot im gemeinsamen Saldenarray zu."""
+        if self._balances is None:
+            return  # ohne NumPy: Konten behalten ihren lokalen int-Saldo
+        idx = self._next_bal_idx
+        if idx == len(self._balances):
+            grown = _np.zeros(idx * 2, dtype=_np.int64)
+            grown[:idx] = self._balances
+            self._balances = grown
+        self._balances[idx] = account._balance_cents
+        account._bank = self
+        account._bal_idx = idx
+        self._next_bal_idx = idx + 1
+
+    def _retire_before(self, sequence: int):
+        """
+        Checkpoint/Rotation: entfernt alle Journal-Einträge mit
+        sequence < 'sequence' aus Bank- und Konto-Journalen und legt die
+        Objekte (bis POOL_MAX) zur Wiederverwendung in die Free-Lists.
+        Achtung: Aufrufer dürfen danach keine Referenzen auf ausrangierte
+        Einträge mehr halten — die Objekte werden bei neuen Buchungen
+        überschrieben.
+        """
+        journal = self._journal
+        pool = self._txn_pool
+        while journal and journal[0].sequence < sequence:
+            txn = journal.popleft()
+            if len(pool) < POOL_MAX:
+                pool.append(txn)
+        pool = self._entry_pool
+        for acc in self._accounts.values():
+            acc_journal = acc._journal
+            while acc_journal and acc_journal[0].sequence < sequence:
+                entry = acc_journal.popleft()
+                if len(pool) < POOL_MAX:
+                    pool.append(entry)
+
+    # Langsamer Pfad für selten aufgerufene API (Abfragen, close_account);
+    # deposit_cash/transfer inlinen Lookup und Aktiv-Check selbst.
     def _get_account(self, account_id: str) -> Account:
         acc = self._accounts.get(account_id)
         if acc is None:
@@ -528,13 +865,12 @@ class Bank:
         return acc
 
     def _book_internal_transfer(self, from_internal: str, to_account: str,
-                                amount: Decimal, type_: str, purpose: Optional[str]) -> Transaction:
+                                amount_cents: int, type_: str, purpose: Optional[str]) -> Transaction:
         """
         Bucht einen Transfer von einem internen Bankkonto auf ein Kundenkonto (oder umgekehrt),
         z.B. für Zinsen ("INTEREST") oder Gebühren (werden an anderer Stelle erzeugt).
         """
-        amount = money(amount)
-        if amount <= money(0):
+        if amount_cents <= 0:
             raise InvalidAmount("Interner Transfer erfordert positiven Betrag.")
 
         # Hier verzichten wir bewusst auf can_withdraw() bei internen Konten.
@@ -543,7 +879,7 @@ class Bank:
             type_=type_,
             from_account=from_internal,
             to_account=to_account,
-            amount=amount,
+            amount_cents=amount_cents,
             purpose=purpose
         )
         self._append_to_journal_and_post(txn)
@@ -552,10 +888,19 @@ class Bank:
     # Optional: einfache Audit-Prüfung (Kohärenz-Check)
     def audit(self) -> None:
         """
-        Führt ein paar grundlegende Konsistenzprüfungen durch.
+        O(1)-Audit: Die Invarianten (from/to je nach Transaktionsart) werden
+        bereits beim Verbuchen in _append_to_journal_and_post geprüft; hier
+        wird nur noch das Ergebnis-Flag gelesen. Für einen vollständigen
+        Scan der Historie siehe _audit_full().
+        """
+        if not self._audit_ok:
+            raise BankError("Journal enthält inkonsistente Transaktionen.")
+
+    def _audit_full(self) -> None:
+        """
+        Debug-Variante: läuft über das komplette Journal (O(N)).
           - Jede TRANSFER/FEE/INTEREST hat from != None und to != None
           - Jede CASH_DEPOSIT hat from == None und to != None
-          - Summe der Beträge pro TRANSFER/FEE/INTEREST ist symmetrisch auf Konten verbucht
         """
         for txn in self._journal:
             if txn.type == "CASH_DEPOSIT":
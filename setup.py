@@ -0,0 +1,14 @@
+"""Baut die optionalen kompilierten Kernels: python setup.py build_ext --inplace"""
+from setuptools import Extension, setup
+
+ext_modules = [
+    Extension("gol_simd", ["gol_simd.c"], extra_compile_args=["-mavx2", "-O3"]),
+]
+
+try:
+    from Cython.Build import cythonize
+    ext_modules += cythonize([Extension("gol_kernel", ["gol_kernel.pyx"])])
+except ImportError:  # ohne Cython nur die C-Extension bauen
+    pass
+
+setup(name="ofp-kernels", ext_modules=ext_modules)
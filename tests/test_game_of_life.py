@@ -2,8 +2,15 @@ from game_of_life import (
     conway_rule,
     highlife_rule,
     step_func,
+    step_func_numpy,
     generations,
     alive_from_strings,
+    to_array,
+    from_array,
+    pack_array,
+    unpack_array,
+    step_packed_torus,
+    step_func_packed,
 )
 
 
@@ -34,6 +41,239 @@ def test_highlife_spawns_on_six_neighbors_only_for_highlife():
     assert (1, 1) in highlife_next
 
 
+def test_grid_from_strings_and_bounded_step():
+    from game_of_life import from_array, grid_from_strings, step_grid
+
+    grid = grid_from_strings([".....", ".###.", "....."])
+    nxt = step_grid(grid)
+    assert from_array(nxt) == alive_from_strings(["..#..", "..#..", "..#.."])
+    # Begrenztes Grid: Zellen am Rand können nicht nach außen wachsen
+    edge = grid_from_strings(["###"])
+    assert from_array(step_grid(edge)) == frozenset({(1, 0)})
+
+
+def test_generations_grid_double_buffers_match_step_grid():
+    import numpy as np
+
+    from game_of_life import generations_grid, grid_from_strings, step_grid
+
+    start = grid_from_strings([".....", ".###.", ".#...", "....."])
+    gen = generations_grid(start)
+    expected = start
+    for _ in range(6):
+        state = next(gen)
+        assert (state == expected).all()
+        assert not state.flags.writeable  # Views zeigen auf die Wechselpuffer
+        expected = step_grid(expected)
+
+
+def test_display_grid_renders_frame(capsys):
+    from game_of_life import display_grid, grid_from_strings
+
+    display_grid(grid_from_strings(["#.", ".#"]))
+    assert capsys.readouterr().out == "#.\n.#\n\n"
+
+
+def test_alive_from_strings_handles_ragged_lines_and_origin():
+    alive = alive_from_strings(["#", ".#", "..#"], origin=(2, -1))
+    assert alive == frozenset({(2, -1), (3, 0), (4, 1)})
+
+
+def test_display_writes_single_frame(capsys):
+    from game_of_life import display
+
+    display(alive_from_strings(["##"]), pad=1)
+    out = capsys.readouterr().out
+    assert out == "....\n.##.\n....\n\n"
+
+
+def test_bbox_single_pass_and_cache():
+    import pytest
+
+    from game_of_life import bbox
+
+    alive = alive_from_strings(["#..", "...", "..#"], origin=(-1, 5))
+    assert bbox(alive, pad=0) == (-1, 1, 5, 7)
+    # Zweiter Aufruf (Cache-Treffer) mit anderem Pad liefert konsistent
+    assert bbox(alive, pad=2) == (-3, 3, 3, 9)
+    with pytest.raises(ValueError):
+        bbox(frozenset())
+
+
+def test_to_array_from_array_roundtrip():
+    alive = alive_from_strings(["#..", ".#.", "..#"], origin=(-2, 3))
+    arr, minx, miny = to_array(alive)
+    assert from_array(arr, minx, miny) == alive
+
+
+def test_numpy_step_matches_set_step():
+    glider = alive_from_strings([".#.", "..#", "###"])
+    step_set = step_func(conway_rule)
+    step_np = step_func_numpy(conway_rule)
+    state_set, state_np = glider, glider
+    for _ in range(8):
+        state_set = step_set(state_set)
+        state_np = step_np(state_np)
+        assert state_np == state_set
+
+
+def test_numpy_step_supports_highlife():
+    crowded = alive_from_strings(["###", "#.#", ".#."])
+    assert step_func_numpy(highlife_rule)(crowded) == step_func(highlife_rule)(crowded)
+
+
+def test_pack_cell_roundtrip_with_negative_coordinates():
+    from game_of_life import pack_cell, unpack_cell
+
+    for cell in [(0, 0), (-5, 17), (123, -456), (-1, -1)]:
+        assert unpack_cell(pack_cell(*cell)) == cell
+
+
+def test_incremental_step_matches_set_step_over_many_generations():
+    from game_of_life import step_func_incremental
+
+    r_pentomino = alive_from_strings([".##", "##.", ".#."])
+    step_ref = step_func(conway_rule)
+    step_inc = step_func_incremental(conway_rule)
+    state_ref, state_inc = r_pentomino, r_pentomino
+    for _ in range(25):
+        state_ref = step_ref(state_ref)
+        state_inc = step_inc(state_inc)
+        assert state_inc == state_ref
+
+
+def test_incremental_step_recovers_from_unrelated_state():
+    from game_of_life import step_func_incremental
+
+    step_inc = step_func_incremental(conway_rule)
+    step_ref = step_func(conway_rule)
+    blinker = alive_from_strings(["###"])
+    block = alive_from_strings(["##", "##"], origin=(10, 10))
+    assert step_inc(blinker) == step_ref(blinker)
+    # Sprung auf einen fremden Zustand erzwingt den Neuaufbau der Zähler
+    assert step_inc(block) == step_ref(block)
+
+
+def test_mp_step_matches_set_step_in_process_and_pooled():
+    import numpy as np
+
+    import game_of_life
+    from game_of_life import step_func_mp
+
+    rng = np.random.default_rng(5)
+    arr = (rng.random((30, 30)) < 0.35).astype(np.uint8)
+    alive = from_array(arr)
+    expected = step_func(conway_rule)(alive)
+
+    # Kleines Grid: In-Process-Pfad
+    step_small = step_func_mp(conway_rule, n_workers=2)
+    assert step_small(alive) == expected
+    step_small.close()
+
+    # Schwelle absenken, um den Pool-Pfad zu erzwingen
+    old = game_of_life.MP_MIN_CELLS
+    game_of_life.MP_MIN_CELLS = 0
+    step_pooled = step_func_mp(conway_rule, n_workers=2)
+    try:
+        assert step_pooled(alive) == expected
+    finally:
+        step_pooled.close()
+        game_of_life.MP_MIN_CELLS = old
+
+
+def test_cuda_step_matches_set_step_or_falls_back():
+    # Ohne CuPy/GPU liefert die Factory den CPU-Fallback — Ergebnis ist gleich
+    from game_of_life import step_func_cuda
+
+    glider = alive_from_strings([".#.", "..#", "###"])
+    assert step_func_cuda(conway_rule)(glider) == step_func(conway_rule)(glider)
+
+
+def test_cython_step_matches_set_step():
+    import numpy as np
+
+    from game_of_life import step_func_cython
+
+    rng = np.random.default_rng(11)
+    arr = (rng.random((15, 40)) < 0.35).astype(np.uint8)
+    alive = from_array(arr)
+    for rule in (conway_rule, highlife_rule):
+        assert step_func_cython(rule)(alive) == step_func(rule)(alive)
+
+
+def test_jit_step_matches_set_step():
+    import numpy as np
+
+    from game_of_life import step_func_jit
+
+    rng = np.random.default_rng(3)
+    arr = (rng.random((15, 40)) < 0.35).astype(np.uint8)
+    alive = from_array(arr)
+    for rule in (conway_rule, highlife_rule):
+        assert step_func_jit(rule)(alive) == step_func(rule)(alive)
+
+
+def test_pack_unpack_roundtrip_beyond_one_word():
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    arr = (rng.random((5, 130)) < 0.4).astype(np.uint8)
+    assert (unpack_array(pack_array(arr), 130) == arr).all()
+
+
+def test_packed_step_matches_set_step():
+    import numpy as np
+
+    rng = np.random.default_rng(42)
+    arr = (rng.random((20, 90)) < 0.35).astype(np.uint8)
+    alive = from_array(arr)
+    for rule in (conway_rule, highlife_rule):
+        assert step_func_packed(rule)(alive) == step_func(rule)(alive)
+
+
+def test_packed_step_matches_set_step_on_wide_grid():
+    import numpy as np
+
+    rng = np.random.default_rng(13)
+    arr = (rng.random((25, 300)) < 0.35).astype(np.uint8)  # 5 Worte breit
+    alive = from_array(arr)
+    assert step_func_packed(conway_rule)(alive) == step_func(conway_rule)(alive)
+
+
+def test_packed_torus_wraps_blinker_across_edge():
+    import numpy as np
+
+    arr = np.zeros((5, 5), dtype=np.uint8)
+    arr[2, 4] = arr[2, 0] = arr[2, 1] = 1  # horizontaler Blinker über den Spaltenrand
+    nxt = unpack_array(step_packed_torus(pack_array(arr), 5), 5)
+    assert from_array(nxt) == frozenset({(0, 1), (0, 2), (0, 3)})
+
+
+def test_custom_rule_takes_generic_step_path():
+    def never_rule(is_alive, n):
+        return False
+
+    blinker = alive_from_strings(["###"])
+    assert step_func(never_rule)(blinker) == frozenset()
+
+
+def test_generations_replays_cycle_without_stepping_again():
+    blinker = alive_from_strings(["...", "###", "..."])
+    real_step = step_func(conway_rule)
+    calls = []
+
+    def counting_step(alive):
+        calls.append(alive)
+        return real_step(alive)
+
+    gen = generations(blinker, counting_step)
+    states = [next(gen) for _ in range(8)]
+    assert states[0] == states[2] == states[4]
+    assert states[1] == states[3] == states[5]
+    # Nach Erkennen der Periode 2 wird step nicht mehr aufgerufen
+    assert len(calls) == 2
+
+
 def test_generations_yields_successive_states():
     start = alive_from_strings([".#.", ".#.", ".#."])
     step = step_func(conway_rule)
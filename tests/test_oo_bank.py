@@ -87,6 +87,37 @@ def test_apply_interest_to_savings_accounts():
     assert bank.get_bank_journal()[-1].type == "INTEREST"
 
 
+def test_vectorized_interest_matches_scalar_path():
+    import oo_bank
+
+    def run_period(min_accounts):
+        old = oo_bank.VECTOR_INTEREST_MIN
+        oo_bank.VECTOR_INTEREST_MIN = min_accounts
+        try:
+            bank = Bank()
+            ids = []
+            for i in range(40):
+                acc_id = bank.open_account("savings", rate="0.02")
+                bank.deposit_cash(acc_id, Decimal(i) + Decimal("0.37"))
+                ids.append(acc_id)
+            bank.apply_interest_to_all_savings()
+            return [bank.get_balance(acc_id) for acc_id in ids]
+        finally:
+            oo_bank.VECTOR_INTEREST_MIN = old
+
+    # Schwelle 1 erzwingt den Vektorpfad, 10**9 den skalaren
+    assert run_period(1) == run_period(10**9)
+
+
+def test_closed_savings_account_gets_no_interest():
+    bank = Bank()
+    savings_id = bank.open_account("savings", rate="0.02")
+    bank.close_account(savings_id)  # Saldo 0 -> zulässig
+
+    assert bank.apply_interest_to_all_savings() == []
+    assert bank.get_balance(savings_id) == money(0)
+
+
 def test_same_account_transfer_is_rejected_early():
     bank = Bank()
     acc_id = bank.open_account("youth")
@@ -95,6 +126,46 @@ def test_same_account_transfer_is_rejected_early():
         bank.transfer(acc_id, acc_id, 10)
 
 
+def test_cents_conversion_roundtrip_and_rounding():
+    from oo_bank import _from_cents, _to_cents
+
+    assert _to_cents("10.555") == 1056  # HALF_UP wie money()
+    assert _to_cents(Decimal("-1")) == -100
+    assert _from_cents(1056) == money("10.56")
+    assert str(_from_cents(0)) == "0.00"
+
+
+def test_fee_rounding_matches_decimal_path():
+    bank = Bank()
+    private_id = bank.open_account("private")
+    youth_id = bank.open_account("youth")
+    bank.deposit_cash(private_id, 100)
+
+    # 1% von 55.55 = 0.5555 -> HALF_UP 0.56 (über der Mindestgebühr)
+    bank.transfer(private_id, youth_id, "55.55")
+
+    assert bank.get_balance(bank.fee_income_account_id) == money("0.56")
+    assert bank.get_balance(private_id) == money("43.89")
+
+
+def test_retire_before_reuses_journal_objects():
+    bank = Bank()
+    acc_id = bank.open_account("youth")
+    bank.deposit_cash(acc_id, 10)
+    first_txn = bank.get_bank_journal()[0]
+    retire_seq = first_txn.sequence + 1
+
+    bank._retire_before(retire_seq)
+
+    assert bank.get_bank_journal() == []
+    assert bank.get_account_entries(acc_id) == []
+    assert bank.get_balance(acc_id) == money(10)  # Saldo bleibt unberührt
+    bank.deposit_cash(acc_id, 5)
+    # Die neue Buchung recycelt das ausrangierte Transaction-Objekt
+    assert bank.get_bank_journal()[0] is first_txn
+    assert first_txn.amount == money(5)
+
+
 def test_deposit_rejects_non_positive_amounts():
     bank = Bank()
     acc_id = bank.open_account("youth")